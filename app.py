@@ -14,8 +14,27 @@ import pandas as pd
 import sqlite3
 import numpy as np
 from datetime import datetime
+import hashlib
+import gzip
+import random
+import threading
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from flask import jsonify, request
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
 import plotly.figure_factory as ff
 
+# brotli is optional, responses fall back to gzip without it
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # Initialize Dash app
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
 app.title = "Employee Attrition Dashboard"
@@ -163,25 +182,26 @@ def get_db_connection():
         print(f"Error connecting to database: {e}")
         return None
 
+# query join tables
+EMPLOYEE_QUERY = """
+SELECT 
+    e.*,
+    d.DepartmentName,
+    j.JobRole,
+    j.JobLevel,
+    ef.FieldName as EducationField
+FROM Employees e
+LEFT JOIN Departments d ON e.DepartmentID = d.DepartmentID
+LEFT JOIN Jobs j ON e.JobID = j.JobID
+LEFT JOIN EducationFields ef ON e.EducationFieldID = ef.EducationFieldID
+"""
+
 # Load data from database
 def load_data_from_db():
     conn = get_db_connection()
     if conn:
         try:
-            # query join tables
-            query = """
-            SELECT 
-                e.*,
-                d.DepartmentName,
-                j.JobRole,
-                j.JobLevel,
-                ef.FieldName as EducationField
-            FROM Employees e
-            LEFT JOIN Departments d ON e.DepartmentID = d.DepartmentID
-            LEFT JOIN Jobs j ON e.JobID = j.JobID
-            LEFT JOIN EducationFields ef ON e.EducationFieldID = ef.EducationFieldID
-            """
-            df = pd.read_sql_query(query, conn)
+            df = pd.read_sql_query(EMPLOYEE_QUERY, conn)
             conn.close()
             print("Successfully loaded data from database")
             print(f"Data shape: {df.shape}")
@@ -193,7 +213,125 @@ def load_data_from_db():
             return pd.DataFrame()
     return pd.DataFrame()
 
+# load a subset of employees (e.g. rows touched by a write)
+def load_employees_where(where, params=()):
+    conn = get_db_connection()
+    if conn:
+        try:
+            subset = pd.read_sql_query(EMPLOYEE_QUERY + " WHERE " + where, conn, params=params)
+            conn.close()
+            return subset
+        except sqlite3.Error as e:
+            print(f"Error reading from database: {e}")
+            conn.close()
+    return pd.DataFrame()
+
+# employment event log (append-only, one row per hire / leave / income change)
+# Backfilled = 1 marks rows derived from the Employees snapshot: their tenure is
+# real but their calendar dates are not
+EVENT_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS EmploymentEvents (
+    EventID INTEGER PRIMARY KEY AUTOINCREMENT,
+    EmployeeID INTEGER NOT NULL,
+    EventType TEXT NOT NULL CHECK (EventType IN ('hire', 'leave', 'income_change')),
+    EventDate TEXT NOT NULL,
+    DepartmentID INTEGER,
+    MonthlyIncome INTEGER,
+    Backfilled INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (EmployeeID) REFERENCES Employees(EmployeeID),
+    FOREIGN KEY (DepartmentID) REFERENCES Departments(DepartmentID)
+);
+"""
+EVENT_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_events_date ON EmploymentEvents (EventDate);
+DROP INDEX IF EXISTS idx_events_type_date;
+CREATE INDEX IF NOT EXISTS idx_events_backfilled_type_date ON EmploymentEvents (Backfilled, EventType, EventDate);
+CREATE INDEX IF NOT EXISTS idx_events_employee ON EmploymentEvents (EmployeeID, EventDate);
+CREATE TRIGGER IF NOT EXISTS events_no_update BEFORE UPDATE ON EmploymentEvents
+BEGIN SELECT RAISE(ABORT, 'EmploymentEvents is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS events_no_delete BEFORE DELETE ON EmploymentEvents
+BEGIN SELECT RAISE(ABORT, 'EmploymentEvents is append-only'); END;
+"""
+
+# create the event table, backfilling it once from the Employees snapshot
+def init_event_log():
+    conn = get_db_connection()
+    if conn:
+        try:
+            conn.executescript(EVENT_TABLE_SCHEMA)
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(EmploymentEvents)")]
+            if 'Backfilled' not in columns:
+                # older logs can't tell backfilled rows apart, so all existing rows are treated as synthetic
+                conn.execute("ALTER TABLE EmploymentEvents ADD COLUMN Backfilled INTEGER NOT NULL DEFAULT 1")
+            conn.executescript(EVENT_SCHEMA)
+            if conn.execute("SELECT COUNT(*) FROM EmploymentEvents").fetchone()[0] == 0:
+                snapshot = pd.read_sql_query(
+                    "SELECT EmployeeID, DepartmentID, MonthlyIncome, YearsAtCompany, Attrition FROM Employees", conn)
+                # the dataset only has tenure, so hires are placed on the YearsAtCompany
+                # anniversary before today and leavers leave today
+                as_of = pd.Timestamp(datetime.now().date())
+                snapshot['HireDate'] = snapshot['YearsAtCompany'].fillna(0).apply(
+                    lambda years: (as_of - pd.DateOffset(years=int(years))).strftime('%Y-%m-%d'))
+                snapshot = snapshot.astype(object).where(snapshot.notna(), None)
+                rows = [(row.EmployeeID, 'hire', row.HireDate, row.DepartmentID, row.MonthlyIncome)
+                        for row in snapshot.itertuples()]
+                rows += [(row.EmployeeID, 'leave', as_of.strftime('%Y-%m-%d'), row.DepartmentID, row.MonthlyIncome)
+                         for row in snapshot[snapshot['Attrition'] == 'Yes'].itertuples()]
+                conn.executemany("""INSERT INTO EmploymentEvents (EmployeeID, EventType, EventDate, DepartmentID, MonthlyIncome, Backfilled)
+                                    VALUES (?, ?, ?, ?, ?, 1)""", rows)
+                conn.commit()
+                print(f"Backfilled {len(rows)} employment events")
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"Error creating event log: {e}")
+            conn.close()
+
+# append an event inside the caller's transaction
+def log_event(cursor, emp_id, event_type, event_date, department_id=None, monthly_income=None):
+    cursor.execute("""INSERT INTO EmploymentEvents (EmployeeID, EventType, EventDate, DepartmentID, MonthlyIncome, Backfilled)
+                      VALUES (?, ?, ?, ?, ?, 0)""",
+                   (emp_id, event_type, event_date, department_id, monthly_income))
+
+# data version, bumped after every successful write so cached results can be keyed on it
+data_version = 0
+data_version_lock = threading.Lock()
+# full reloads run outside the lock; tickets stop an older reload replacing a newer one
+reload_ticket = 0
+applied_reload_ticket = 0
+
+# refresh the employee data, move to a new version and re-warm the caches for it;
+# with employee_ids only those rows are re-read (by primary key) and patched into df
+def bump_data_version(employee_ids=None):
+    global data_version, df, reload_ticket, applied_reload_ticket
+    if employee_ids is None or df.empty or 'EmployeeID' not in df.columns:
+        with data_version_lock:
+            reload_ticket += 1
+            ticket = reload_ticket
+        fresh_df = load_data_from_db()
+        with data_version_lock:
+            if not fresh_df.empty and ticket > applied_reload_ticket:
+                df = fresh_df
+                applied_reload_ticket = ticket
+            data_version += 1
+            version = data_version
+    else:
+        employee_ids = [int(emp_id) for emp_id in employee_ids]
+        with data_version_lock:
+            changed = load_employees_where(f"e.EmployeeID IN ({', '.join('?' * len(employee_ids))})", tuple(employee_ids))
+            # a few rows full of NULLs come back as object columns; match df's dtypes
+            for col in df.columns.intersection(changed.columns):
+                if pd.api.types.is_numeric_dtype(df[col]):
+                    changed[col] = pd.to_numeric(changed[col], errors='coerce')
+                else:
+                    changed[col] = changed[col].astype(df[col].dtype)
+            df = pd.concat([df[~df['EmployeeID'].isin(employee_ids)], changed], ignore_index=True)
+            data_version += 1
+            version = data_version
+    warmup.schedule(version)
+    return version
+
 # load data
+init_event_log()
 df = load_data_from_db()
 
 # calculat some statistic for the dashboard
@@ -208,6 +346,493 @@ else:
     avg_income = 0
     avg_satisfaction = 0
 
+
+#--------------------------------------------------------------
+# Data quality profiling (mergeable sketches)
+#--------------------------------------------------------------
+# id columns are keys, not measurements, so they are not profiled
+PROFILE_EXCLUDE = ['EmployeeID', 'DepartmentID', 'JobID', 'EducationFieldID']
+ALL_DEPARTMENTS = '__all__'
+
+# KLL quantile sketch: fixed memory, can be merged across partitions
+class KLLSketch:
+    def __init__(self, k=200, seed=0):
+        self.k = k
+        self.n = 0
+        self.compactors = [[]]
+        self.rng = random.Random(seed)
+
+    def capacity(self, level):
+        depth = len(self.compactors) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, value):
+        self.update_batch([value])
+
+    # add a whole column at once and compress a single time
+    def update_batch(self, values):
+        values = list(values)
+        if not values:
+            return
+        self.compactors[0].extend(values)
+        self.n += len(values)
+        self.compress()
+
+    def merge(self, other):
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.n += other.n
+        self.compress()
+        return self
+
+    def compress(self):
+        level = 0
+        while level < len(self.compactors):
+            items = self.compactors[level]
+            if len(items) >= self.capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append([])
+                items.sort()
+                # keep the odd item out at this level so no weight is lost
+                leftover = [items.pop()] if len(items) % 2 else []
+                offset = self.rng.randint(0, 1)
+                self.compactors[level + 1].extend(items[offset::2])
+                self.compactors[level] = leftover
+            level += 1
+
+    def weighted_items(self):
+        values = []
+        weights = []
+        for level, items in enumerate(self.compactors):
+            values.extend(items)
+            weights.extend([2 ** level] * len(items))
+        order = np.argsort(values, kind='stable')
+        return np.asarray(values, dtype=float)[order], np.asarray(weights, dtype=float)[order]
+
+    def quantiles(self, qs):
+        values, weights = self.weighted_items()
+        if len(values) == 0:
+            return [np.nan for _ in qs]
+        cumulative = np.cumsum(weights) / weights.sum()
+        idx = np.searchsorted(cumulative, qs, side='left')
+        return values[np.minimum(idx, len(values) - 1)].tolist()
+
+    # fraction of values strictly below x
+    def rank(self, x):
+        values, weights = self.weighted_items()
+        if len(values) == 0:
+            return 0.0
+        return weights[values < x].sum() / weights.sum()
+
+
+# HyperLogLog distinct count: merge is an element-wise max of registers
+class HyperLogLog:
+    def __init__(self, p=12):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    # splitmix64 over the float64 bit pattern, vectorized with numpy
+    @staticmethod
+    def hash_values(values):
+        # + 0.0 folds -0.0 into 0.0 so both hash the same
+        h = (np.asarray(values, dtype=np.float64) + 0.0).view(np.uint64)
+        with np.errstate(over='ignore'):
+            h = h + np.uint64(0x9E3779B97F4A7C15)
+            h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+            h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return h ^ (h >> np.uint64(31))
+
+    @staticmethod
+    def bit_length(x):
+        length = np.zeros(len(x), dtype=np.uint8)
+        for shift in (32, 16, 8, 4, 2, 1):
+            high = x >= (np.uint64(1) << np.uint64(shift))
+            length[high] += shift
+            x = np.where(high, x >> np.uint64(shift), x)
+        return length + (x > 0)
+
+    def update(self, value):
+        self.update_batch([value])
+
+    def update_batch(self, values):
+        if len(values) == 0:
+            return
+        h = self.hash_values(values)
+        idx = (h >> np.uint64(64 - self.p)).astype(np.intp)
+        rest = h & np.uint64((1 << (64 - self.p)) - 1)
+        rank = ((64 - self.p) + 1 - self.bit_length(rest)).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        estimate = alpha * self.m ** 2 / np.sum(2.0 ** -self.registers.astype(float))
+        zeros = np.count_nonzero(self.registers == 0)
+        # linear counting is more accurate for small cardinalities
+        if estimate <= 2.5 * self.m and zeros:
+            estimate = self.m * np.log(self.m / zeros)
+        return int(round(estimate))
+
+
+# per column profile: row count, null count, quantiles and distinct count
+class ColumnProfile:
+    def __init__(self):
+        self.count = 0
+        self.nulls = 0
+        self.quantile_sketch = KLLSketch()
+        self.distinct_sketch = HyperLogLog()
+
+    def update(self, value):
+        self.update_batch([value])
+
+    def update_batch(self, values):
+        values = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=float)
+        valid = values[~np.isnan(values)]
+        self.count += len(values)
+        self.nulls += len(values) - len(valid)
+        self.quantile_sketch.update_batch(valid.tolist())
+        self.distinct_sketch.update_batch(valid)
+
+    def merge(self, other):
+        self.count += other.count
+        self.nulls += other.nulls
+        self.quantile_sketch.merge(other.quantile_sketch)
+        self.distinct_sketch.merge(other.distinct_sketch)
+        return self
+
+    def summary(self):
+        q = self.quantile_sketch.quantiles([0, 0.25, 0.5, 0.75, 1])
+        iqr = q[3] - q[1]
+        lower_fence = q[1] - 1.5 * iqr
+        upper_fence = q[3] + 1.5 * iqr
+        sketch = self.quantile_sketch
+        if sketch.n:
+            outlier_share = sketch.rank(lower_fence) + 1 - sketch.rank(np.nextafter(upper_fence, np.inf))
+        else:
+            outlier_share = 0.0
+        return {
+            'Count': self.count,
+            'Nulls': self.nulls,
+            'Distinct': self.distinct_sketch.count() if sketch.n else 0,
+            'Min': q[0], 'Q1': q[1], 'Median': q[2], 'Q3': q[3], 'Max': q[4],
+            'LowerFence': lower_fence,
+            'UpperFence': upper_fence,
+            'Outliers': int(round(outlier_share * sketch.n)),
+        }
+
+
+# sketches are kept per department (partition) and merged for the company view
+class DataProfiler:
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.partitions = {}
+        self.lock = threading.Lock()
+
+    def new_partition(self):
+        return {col: ColumnProfile() for col in self.columns}
+
+    # sketch a frame per department, outside the lock
+    def build_partitions(self, frame):
+        partitions = {}
+        if frame.empty:
+            return partitions
+        for dept, group in frame.groupby(frame['DepartmentName'].fillna('Unknown')):
+            partition = partitions[dept] = self.new_partition()
+            for col in self.columns:
+                if col in group.columns:
+                    partition[col].update_batch(group[col].to_numpy())
+        return partitions
+
+    def update_rows(self, frame):
+        new_partitions = self.build_partitions(frame)
+        with self.lock:
+            for dept, partition in new_partitions.items():
+                if dept in self.partitions:
+                    for col in self.columns:
+                        self.partitions[dept][col].merge(partition[col])
+                else:
+                    self.partitions[dept] = partition
+
+    # sketches can't forget values, so updated rows rebuild their partition;
+    # the new partition is swapped in under one lock so readers never miss it
+    def rebuild_partition(self, dept, frame):
+        partition = self.build_partitions(frame).get(dept)
+        with self.lock:
+            if partition is None:
+                self.partitions.pop(dept, None)
+            else:
+                self.partitions[dept] = partition
+
+    def merged(self, dept=ALL_DEPARTMENTS):
+        with self.lock:
+            if dept == ALL_DEPARTMENTS:
+                parts = list(self.partitions.values())
+            else:
+                parts = [self.partitions[dept]] if dept in self.partitions else []
+            merged = self.new_partition()
+            for part in parts:
+                for col in self.columns:
+                    merged[col].merge(part[col])
+        return merged
+
+    def summary_frame(self, dept=ALL_DEPARTMENTS):
+        merged = self.merged(dept)
+        rows = [dict(Column=col, **merged[col].summary()) for col in self.columns]
+        return pd.DataFrame(rows)
+
+
+profile_columns = [col for col in df.select_dtypes(include='number').columns if col not in PROFILE_EXCLUDE] if not df.empty else []
+profiler = DataProfiler(profile_columns)
+if not df.empty:
+    profiler.update_rows(df)
+
+
+#--------------------------------------------------------------
+# Attrition history (cohort retention and survival curves)
+#--------------------------------------------------------------
+# results are cached per data version, so any write invalidates them
+# one row per employee: hire date, leave date (NaT if still employed) and department
+@lru_cache(maxsize=2)
+def load_tenure_table(version):
+    conn = get_db_connection()
+    if not conn:
+        return pd.DataFrame()
+    try:
+        events = pd.read_sql_query("""
+            SELECT EmployeeID, EventType, EventDate, Backfilled FROM EmploymentEvents
+            WHERE EventType IN ('hire', 'leave')
+            """, conn)
+        departments = pd.read_sql_query("""
+            SELECT e.EmployeeID, d.DepartmentName FROM Employees e
+            LEFT JOIN Departments d ON e.DepartmentID = d.DepartmentID
+            """, conn)
+        conn.close()
+    except sqlite3.Error as e:
+        print(f"Error reading event log: {e}")
+        conn.close()
+        return pd.DataFrame()
+
+    events['EventDate'] = pd.to_datetime(events['EventDate'])
+    hire_events = events[events['EventType'] == 'hire'].groupby('EmployeeID')
+    hires = hire_events['EventDate'].min().rename('HireDate')
+    # a backfilled hire date is only a tenure, not a real calendar date
+    backfilled = hire_events['Backfilled'].max().astype(bool).rename('Backfilled')
+    leaves = events[events['EventType'] == 'leave'].groupby('EmployeeID')['EventDate'].max().rename('LeaveDate')
+    tenure = hires.to_frame().join(backfilled).join(leaves, how='left')
+    tenure = tenure.join(departments.set_index('EmployeeID'), how='left')
+    tenure['DepartmentName'] = tenure['DepartmentName'].fillna('Unknown')
+
+    as_of = pd.Timestamp(datetime.now().date())
+    end = tenure['LeaveDate'].fillna(as_of)
+    tenure['Years'] = (end - tenure['HireDate']).dt.days.clip(lower=0) / 365.25
+    tenure['Left'] = tenure['LeaveDate'].notna()
+    tenure['ElapsedYears'] = (as_of - tenure['HireDate']).dt.days.clip(lower=0) / 365.25
+    tenure['Cohort'] = tenure['HireDate'].dt.year
+    return tenure.reset_index()
+
+# Kaplan-Meier estimator, vectorized over all employees
+def kaplan_meier(durations, observed):
+    times, inverse = np.unique(durations, return_inverse=True)
+    exits = np.bincount(inverse, minlength=len(times))
+    leavers = np.bincount(inverse, weights=observed.astype(float), minlength=len(times))
+    at_risk = len(durations) - np.concatenate([[0], np.cumsum(exits)[:-1]])
+    survival = np.cumprod(1 - leavers / at_risk)
+    return times, survival, at_risk
+
+# survival curves by YearsAtCompany, one per department plus the company
+@lru_cache(maxsize=8)
+def survival_curves(version):
+    tenure = load_tenure_table(version)
+    curves = []
+    if tenure.empty:
+        return pd.DataFrame(columns=['Department', 'Years', 'Survival', 'AtRisk'])
+    groups = [('All Departments', tenure)] + list(tenure.groupby('DepartmentName'))
+    for dept, group in groups:
+        times, survival, at_risk = kaplan_meier(group['Years'].to_numpy(), group['Left'].to_numpy())
+        # curve starts at 100% retained on the hire date
+        curves.append(pd.DataFrame({
+            'Department': dept,
+            'Years': np.concatenate([[0.0], times]),
+            'Survival': np.concatenate([[1.0], survival]) * 100,
+            'AtRisk': np.concatenate([[len(group)], at_risk]),
+        }))
+    return pd.concat(curves, ignore_index=True)
+
+# Kaplan-Meier survival at the given times (1.0 before the first exit)
+def survival_at(times, survival, at):
+    idx = np.searchsorted(times, at, side='right') - 1
+    return np.where(idx >= 0, survival[np.maximum(idx, 0)], 1.0)
+
+# share of each hire-year cohort still employed at the end of year k after hire
+# (or today, for the year in progress); leavers exit at their tenure and current
+# employees are censored, so each cohort row is its own Kaplan-Meier curve
+@lru_cache(maxsize=16)
+def cohort_retention(version, dept=ALL_DEPARTMENTS, max_years=10):
+    tenure = load_tenure_table(version)
+    # cohorts need real hire dates, so backfilled employees are left out
+    if not tenure.empty:
+        tenure = tenure[~tenure['Backfilled']]
+    if dept != ALL_DEPARTMENTS and not tenure.empty:
+        tenure = tenure[tenure['DepartmentName'] == dept]
+    if tenure.empty:
+        return pd.DataFrame()
+    cohorts = np.sort(tenure['Cohort'].unique())
+    year_ends = np.arange(1, max_years + 2, dtype=float)
+    retention = np.full((len(cohorts), max_years + 1), np.nan)
+    for row, (cohort, group) in enumerate(tenure.groupby('Cohort', sort=True)):
+        times, survival, _ = kaplan_meier(group['Years'].to_numpy(), group['Left'].to_numpy())
+        # a year is shown once the cohort's earliest hire has reached it
+        reached = group['ElapsedYears'].max()
+        observable = year_ends - 1 <= reached
+        at = np.minimum(year_ends, reached)
+        retention[row, observable] = survival_at(times, survival, at[observable]) * 100
+    return pd.DataFrame(retention, index=cohorts, columns=list(range(max_years + 1)))
+
+# recorded (not backfilled) hires and leavers per month in a date range
+# (served by the Backfilled, EventType, EventDate index)
+@lru_cache(maxsize=32)
+def event_counts(version, start_date, end_date):
+    conn = get_db_connection()
+    if not conn:
+        return pd.DataFrame(columns=['Period', 'EventType', 'Events'])
+    try:
+        counts = pd.read_sql_query("""
+            SELECT substr(EventDate, 1, 7) AS Period, EventType, COUNT(*) AS Events
+            FROM EmploymentEvents
+            WHERE Backfilled = 0 AND EventType IN ('hire', 'leave') AND EventDate BETWEEN ? AND ?
+            GROUP BY Period, EventType
+            ORDER BY Period
+            """, conn, params=(start_date, end_date))
+        conn.close()
+        return counts
+    except sqlite3.Error as e:
+        print(f"Error reading event log: {e}")
+        conn.close()
+        return pd.DataFrame(columns=['Period', 'EventType', 'Events'])
+
+
+#--------------------------------------------------------------
+# What-if simulation (in memory, never written to the database)
+#--------------------------------------------------------------
+MODEL_NUMERIC_FEATURES = ['Age', 'MonthlyIncome', 'JobLevel', 'TotalWorkingYears', 'YearsAtCompany',
+                          'YearsInCurrentRole', 'YearsSinceLastPromotion', 'YearsWithCurrManager',
+                          'NumCompaniesWorked', 'DistanceFromHome', 'JobSatisfaction', 'EnvironmentSatisfaction',
+                          'WorkLifeBalance', 'JobInvolvement', 'StockOptionLevel', 'TrainingTimesLastYear']
+MODEL_CATEGORICAL_FEATURES = ['OverTime', 'BusinessTravel', 'MaritalStatus', 'JobRole', 'DepartmentName']
+MODEL_FEATURES = MODEL_NUMERIC_FEATURES + MODEL_CATEGORICAL_FEATURES
+# income changes offered by the sweep chart (%)
+INCOME_SWEEP = list(range(-20, 55, 5))
+
+# logistic regression attrition model plus the baseline score of every employee
+@lru_cache(maxsize=2)
+def attrition_model(version):
+    # take one reference, a write may swap df while the model is fitting
+    data = df
+    population = data[[col for col in MODEL_FEATURES if col in data.columns]].copy()
+    missing = [col for col in MODEL_FEATURES if col not in population.columns]
+    if missing or 'Attrition' not in data.columns or data['Attrition'].nunique() < 2:
+        return None, population, np.array([])
+    model = Pipeline([
+        ('prep', ColumnTransformer([
+            ('num', make_pipeline(SimpleImputer(strategy='median'), StandardScaler()), MODEL_NUMERIC_FEATURES),
+            ('cat', make_pipeline(SimpleImputer(strategy='most_frequent'), OneHotEncoder(handle_unknown='ignore')), MODEL_CATEGORICAL_FEATURES),
+        ])),
+        ('clf', LogisticRegression(max_iter=1000)),
+    ])
+    model.fit(population, data['Attrition'] == 'Yes')
+    baseline = model.predict_proba(population)[:, 1]
+    return model, population, baseline
+
+# apply a policy to the filtered population and re-score it; memoized per policy
+@lru_cache(maxsize=256)
+def simulate_policy(version, department=None, job_role=None, income_change_pct=0.0, overtime=None):
+    model, population, baseline = attrition_model(version)
+    if model is None:
+        return None
+
+    mask = np.ones(len(population), dtype=bool)
+    if department:
+        mask &= (population['DepartmentName'] == department).to_numpy()
+    if job_role:
+        mask &= (population['JobRole'] == job_role).to_numpy()
+
+    projected = baseline.copy()
+    if mask.any():
+        affected = population[mask].copy()
+        if income_change_pct:
+            affected['MonthlyIncome'] = affected['MonthlyIncome'] * (1 + income_change_pct / 100)
+        if overtime:
+            affected['OverTime'] = overtime
+        projected[mask] = model.predict_proba(affected)[:, 1]
+
+    scores = pd.DataFrame({
+        'JobRole': population['JobRole'],
+        'DepartmentName': population['DepartmentName'],
+        'Baseline': baseline * 100,
+        'Projected': projected * 100,
+    })
+    return {
+        'affected_employees': int(mask.sum()),
+        'baseline_rate': float(baseline.mean() * 100),
+        'projected_rate': float(projected.mean() * 100),
+        'affected_baseline_rate': float(baseline[mask].mean() * 100) if mask.any() else None,
+        'affected_projected_rate': float(projected[mask].mean() * 100) if mask.any() else None,
+        'by_job_role': scores.groupby('JobRole')[['Baseline', 'Projected']].mean().reset_index(),
+        'by_department': scores.groupby('DepartmentName')[['Baseline', 'Projected']].mean().reset_index(),
+    }
+
+# check an API / UI policy and turn it into simulate_policy arguments
+def parse_policy(department, job_role, income_change_pct, overtime):
+    if department is not None and not isinstance(department, str):
+        raise ValueError("department must be a string")
+    if job_role is not None and not isinstance(job_role, str):
+        raise ValueError("job_role must be a string")
+    # df is empty (no columns) when the database could not be read
+    if department and department not in (set(df['DepartmentName'].dropna()) if 'DepartmentName' in df.columns else set()):
+        raise ValueError(f"Unknown department: {department}")
+    if job_role and job_role not in (set(df['JobRole'].dropna()) if 'JobRole' in df.columns else set()):
+        raise ValueError(f"Unknown job role: {job_role}")
+    # bool is an int subclass, so true would otherwise become 1%
+    if isinstance(income_change_pct, bool):
+        raise ValueError("income_change_pct must be a number")
+    try:
+        income_change_pct = round(float(income_change_pct or 0), 2)
+    except (TypeError, ValueError):
+        raise ValueError("income_change_pct must be a number")
+    if not -90 <= income_change_pct <= 500:
+        raise ValueError("income_change_pct must be between -90 and 500")
+    if overtime not in (None, '', 'Yes', 'No'):
+        raise ValueError("overtime must be 'Yes', 'No' or empty")
+    return department or None, job_role or None, income_change_pct, overtime or None
+
+# simulation API, e.g. {"job_role": "Sales Representative", "income_change_pct": 10}
+@app.server.route('/api/simulate', methods=['POST'])
+def simulate_api():
+    body = request.get_json(silent=True)
+    if body is None:
+        body = {}
+    if not isinstance(body, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    try:
+        policy = parse_policy(body.get('department'), body.get('job_role'),
+                              body.get('income_change_pct'), body.get('overtime'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    result = simulate_policy(data_version, *policy)
+    if result is None:
+        return jsonify({'error': 'Attrition model is not available'}), 503
+    response = {key: value for key, value in result.items() if not isinstance(value, pd.DataFrame)}
+    response['by_job_role'] = result['by_job_role'].round(2).to_dict('records')
+    response['by_department'] = result['by_department'].round(2).to_dict('records')
+    response['policy'] = dict(zip(['department', 'job_role', 'income_change_pct', 'overtime'], policy))
+    return jsonify(response)
+
 # --------------------------------------------------------------
 # App Layout and Callbacks
 #--------------------------------------------------------------
@@ -222,6 +847,9 @@ app.layout = html.Div([
             html.Span('Employee Attrition Dashboard', className='navbar-brand'),
             dcc.Link('Overview', href='/', className='nav-link'),
             dcc.Link('Employee Management', href='/employee-management', className='nav-link'),
+            dcc.Link('Data Quality', href='/data-quality', className='nav-link'),
+            dcc.Link('Attrition History', href='/attrition-history', className='nav-link'),
+            dcc.Link('What-If Simulation', href='/what-if', className='nav-link'),
         ], style={'display': 'flex', 'alignItems': 'center'})
     ], className='navbar'),
     
@@ -412,6 +1040,9 @@ employee_management_layout = html.Div([
                     options=[{'label': 'Yes', 'value': 'Yes'}, {'label': 'No', 'value': 'No'}],
                     className='form-control'
                 ),
+
+                html.Label("Hire Date", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                html.Div(dcc.DatePickerSingle(id='new-hire-date', date=datetime.now().date(), display_format='YYYY-MM-DD')),
                 
                 html.Button('Add Employee', id='add-employee-btn', n_clicks=0, className='btn-success', style={'marginTop': '10px'})
             ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top', 'paddingRight': '20px'}),
@@ -425,7 +1056,17 @@ employee_management_layout = html.Div([
                 html.Label("New Monthly Income", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
                 dcc.Input(id='update-income', type='number', placeholder='Enter new monthly income', className='form-control'),
                 
-                html.Button('Update Income', id='update-income-btn', n_clicks=0, className='btn-primary', style={'marginTop': '10px'})
+                html.Button('Update Income', id='update-income-btn', n_clicks=0, className='btn-primary', style={'marginTop': '10px'}),
+
+                # record leave
+                html.H3('Record Employee Leave', style={'marginBottom': '20px', 'marginTop': '30px'}),
+                html.Label("Employee ID", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                dcc.Input(id='leave-employee-id', type='number', placeholder='Enter employee ID', className='form-control'),
+
+                html.Label("Leave Date", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                html.Div(dcc.DatePickerSingle(id='leave-date', date=datetime.now().date(), display_format='YYYY-MM-DD')),
+
+                html.Button('Record Leave', id='record-leave-btn', n_clicks=0, className='btn-primary', style={'marginTop': '10px'})
             ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
         ]),
         
@@ -439,6 +1080,188 @@ employee_management_layout = html.Div([
     ], className='card', style={'marginTop': '30px'}),
 ])
 
+# Data Quality page
+data_quality_layout = html.Div([
+    html.H2('Data Quality and Outlier Profile', style={'marginBottom': '30px'}),
+
+    # filter
+    html.Div([
+        html.H3('Filters', style={'marginBottom': '20px'}),
+        html.Div([
+            html.Div([
+                html.Label("Select Department:", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                dcc.Dropdown(
+                    id='dq-dept-filter',
+                    options=[{'label': 'All Departments', 'value': ALL_DEPARTMENTS}] + ([{'label': dept, 'value': dept} for dept in df['DepartmentName'].dropna().unique()] if 'DepartmentName' in df.columns else []),
+                    value=ALL_DEPARTMENTS,
+                    clearable=False,
+                    className='dropdown'
+                ),
+            ], style={'width': '48%', 'display': 'inline-block', 'marginRight': '4%'}),
+
+            html.Div([
+                html.Label("Select Column:", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                dcc.Dropdown(
+                    id='dq-column-filter',
+                    options=[{'label': col, 'value': col} for col in profile_columns],
+                    value='MonthlyIncome' if 'MonthlyIncome' in profile_columns else (profile_columns[0] if profile_columns else None),
+                    clearable=False,
+                    className='dropdown'
+                ),
+            ], style={'width': '48%', 'display': 'inline-block'}),
+        ]),
+    ], className='filter-card'),
+
+    html.Div([
+        html.Div([
+            html.H4('Distribution', className='chart-title'),
+            html.Div([
+                html.P("This chart shows the quartiles and IQR outlier fences of the selected column, computed from streaming quantile sketches that are updated on every write.", className='chart-description'),
+                dcc.Graph(id='dq-distribution-chart'),
+            ], className='chart-container'),
+        ], style={'width': '48%', 'display': 'inline-block', 'marginRight': '4%', 'verticalAlign': 'top'}),
+
+        html.Div([
+            html.H4('Estimated Outliers', className='chart-title'),
+            html.Div([
+                html.P("This chart shows the estimated number of values outside 1.5 x IQR for every numeric column, the same check used in the notebook.", className='chart-description'),
+                dcc.Graph(id='dq-outlier-chart'),
+            ], className='chart-container'),
+        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
+    ]),
+
+    html.Div([
+        html.H3('Column Profile', style={'marginBottom': '20px'}),
+        html.P("Distinct counts and quantiles are approximate (HyperLogLog and KLL sketches).", className='chart-description'),
+        html.Div(id='dq-profile-table')
+    ], className='card'),
+])
+
+# Attrition History page
+attrition_history_layout = html.Div([
+    html.H2('Attrition History', style={'marginBottom': '30px'}),
+
+    # filter
+    html.Div([
+        html.H3('Filters', style={'marginBottom': '20px'}),
+        html.Div([
+            html.Div([
+                html.Label("Select Department:", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                dcc.Dropdown(
+                    id='history-dept-filter',
+                    options=[{'label': 'All Departments', 'value': ALL_DEPARTMENTS}] + ([{'label': dept, 'value': dept} for dept in df['DepartmentName'].dropna().unique()] if 'DepartmentName' in df.columns else []),
+                    value=ALL_DEPARTMENTS,
+                    clearable=False,
+                    className='dropdown'
+                ),
+            ], style={'width': '48%', 'display': 'inline-block', 'marginRight': '4%'}),
+
+            html.Div([
+                html.Label("Select Date Range:", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                html.Div(dcc.DatePickerRange(
+                    id='history-date-range',
+                    start_date=(pd.Timestamp(datetime.now().date()) - pd.DateOffset(years=10)).date(),
+                    end_date=datetime.now().date(),
+                    display_format='YYYY-MM-DD'
+                )),
+            ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
+        ]),
+    ], className='filter-card'),
+
+    html.Div([
+        html.Div([
+            html.H4('Employee Survival Curve', className='chart-title'),
+            html.Div([
+                html.P("This chart shows the Kaplan-Meier estimate of the share of employees still at the company after a given number of years, by department. Current employees are counted as censored.", className='chart-description'),
+                dcc.Graph(id='survival-chart'),
+            ], className='chart-container'),
+        ], style={'width': '48%', 'display': 'inline-block', 'marginRight': '4%', 'verticalAlign': 'top'}),
+
+        html.Div([
+            html.H4('Cohort Retention', className='chart-title'),
+            html.Div([
+                html.P("This heatmap shows the percentage of each hire-year cohort still employed at the end of each year after hire (or today, for the year in progress), for the selected department. Leavers count as exits and current employees are censored. Employees imported from the original dataset have no real hire dates and are not included.", className='chart-description'),
+                dcc.Graph(id='cohort-chart'),
+            ], className='chart-container'),
+        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
+    ]),
+
+    html.Div([
+        html.H4('Hires and Leavers Over Time', className='chart-title'),
+        html.Div([
+            html.P("This chart shows the number of hire and leave events per month in the selected date range, company-wide. Only events recorded in the app are counted, since the imported dataset has no event dates.", className='chart-description'),
+            dcc.Graph(id='event-trend-chart'),
+        ], className='chart-container'),
+    ]),
+])
+
+# What-If Simulation page
+what_if_layout = html.Div([
+    html.H2('What-If Policy Simulation', style={'marginBottom': '30px'}),
+
+    # policy
+    html.Div([
+        html.H3('Policy', style={'marginBottom': '20px'}),
+        html.P("Changes are applied in memory to the selected employees and re-scored with an attrition model trained on the current data. Nothing is written to the database.", className='chart-description'),
+        html.Div([
+            html.Div([
+                html.Label("Department:", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                dcc.Dropdown(
+                    id='sim-dept',
+                    options=[{'label': dept, 'value': dept} for dept in df['DepartmentName'].dropna().unique()] if 'DepartmentName' in df.columns else [],
+                    placeholder='All Departments',
+                    className='dropdown'
+                ),
+
+                html.Label("Job Role:", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                dcc.Dropdown(
+                    id='sim-jobrole',
+                    options=[{'label': role, 'value': role} for role in sorted(df['JobRole'].dropna().unique())] if 'JobRole' in df.columns else [],
+                    placeholder='All Job Roles',
+                    className='dropdown'
+                ),
+            ], style={'width': '48%', 'display': 'inline-block', 'marginRight': '4%', 'verticalAlign': 'top'}),
+
+            html.Div([
+                html.Label("Monthly Income Change (%):", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                dcc.Slider(id='sim-income-pct', min=INCOME_SWEEP[0], max=INCOME_SWEEP[-1], step=5, value=0,
+                           marks={pct: f"{pct:+d}%" for pct in INCOME_SWEEP[::2]}),
+
+                html.Label("OverTime:", style={'fontWeight': 'bold', 'marginBottom': '5px'}),
+                dcc.RadioItems(
+                    id='sim-overtime',
+                    options=[{'label': ' Unchanged', 'value': ''},
+                             {'label': ' No overtime', 'value': 'No'},
+                             {'label': ' Everyone on overtime', 'value': 'Yes'}],
+                    value='',
+                    labelStyle={'display': 'block', 'marginBottom': '5px'}
+                ),
+            ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
+        ]),
+    ], className='filter-card'),
+
+    # cards
+    html.Div(id='sim-cards', style={'marginBottom': '30px'}),
+
+    html.Div([
+        html.Div([
+            html.H4('Projected Attrition by Job Role', className='chart-title'),
+            html.Div([
+                html.P("This chart compares the model's baseline attrition rate with the projected rate under the policy, for each job role.", className='chart-description'),
+                dcc.Graph(id='sim-jobrole-chart'),
+            ], className='chart-container'),
+        ], style={'width': '48%', 'display': 'inline-block', 'marginRight': '4%', 'verticalAlign': 'top'}),
+
+        html.Div([
+            html.H4('Income Change Sweep', className='chart-title'),
+            html.Div([
+                html.P("This chart shows the projected attrition rate of the selected employees across a range of income changes, with the overtime policy held fixed.", className='chart-description'),
+                dcc.Graph(id='sim-sweep-chart'),
+            ], className='chart-container'),
+        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
+    ]),
+])
+
 # switch between pages
 @app.callback(
     Output('page-content', 'children'),
@@ -447,6 +1270,12 @@ employee_management_layout = html.Div([
 def display_page(pathname):
     if pathname == '/employee-management':
         return employee_management_layout
+    elif pathname == '/data-quality':
+        return data_quality_layout
+    elif pathname == '/attrition-history':
+        return attrition_history_layout
+    elif pathname == '/what-if':
+        return what_if_layout
     else:
         return overview_layout
 
@@ -462,11 +1291,15 @@ def display_page(pathname):
      Output('overall-income-chart', 'figure')],
     [Input('dept-filter', 'value')]
 )
+def update_charts(selected_dept):
+    return compute_charts(selected_dept or None, data_version)
 
 #--------------------------------------------------------------
 # function to update charts based on filter
 #--------------------------------------------------------------
-def update_charts(selected_dept):
+# cached per department and data version, and precomputed by the warm-up scheduler
+@lru_cache(maxsize=16)
+def compute_charts(selected_dept, version):
     # filter department
     if selected_dept and 'DepartmentName' in df.columns:
         filtered_df = df[df['DepartmentName'] == selected_dept]
@@ -614,24 +1447,243 @@ def update_charts(selected_dept):
     return (jobrole_fig, overtime_fig, marital_fig, travel_fig, income_fig, 
             heatmap_fig, overall_jobrole_fig, overall_income_fig)
 
+# merged sketch summary, cached per data version
+@lru_cache(maxsize=16)
+def profile_summary(version, dept):
+    return profiler.summary_frame(dept)
+
+# callbacks for data quality
+@app.callback(
+    [Output('dq-distribution-chart', 'figure'),
+     Output('dq-outlier-chart', 'figure'),
+     Output('dq-profile-table', 'children')],
+    [Input('dq-dept-filter', 'value'),
+     Input('dq-column-filter', 'value')]
+)
+
+#--------------------------------------------------------------
+# function to update data quality panels from the sketches
+#--------------------------------------------------------------
+def update_data_quality(selected_dept, selected_column):
+    summary = profile_summary(data_version, selected_dept or ALL_DEPARTMENTS)
+    if summary.empty:
+        empty_fig = go.Figure()
+        empty_fig.add_annotation(text="No numeric data available for profiling", x=0.5, y=0.5, showarrow=False)
+        return empty_fig, empty_fig, html.Div("No numeric data available for profiling")
+
+    # distribution (box drawn from sketch quartiles, whiskers at the IQR fences)
+    stats = summary[summary['Column'] == selected_column]
+    if not stats.empty and stats.iloc[0]['Count'] > stats.iloc[0]['Nulls']:
+        row = stats.iloc[0]
+        distribution_fig = go.Figure(go.Box(
+            name=selected_column,
+            q1=[row['Q1']], median=[row['Median']], q3=[row['Q3']],
+            lowerfence=[max(row['Min'], row['LowerFence'])],
+            upperfence=[min(row['Max'], row['UpperFence'])],
+            marker_color='#4F008C',
+        ))
+        distribution_fig.update_layout(title=f'{selected_column} Quartiles and Outlier Fences',
+                                       plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    else:
+        distribution_fig = go.Figure()
+        distribution_fig.add_annotation(text=f"No values available for {selected_column}", x=0.5, y=0.5, showarrow=False)
+
+    # outliers per column
+    outlier_fig = px.bar(summary, x='Column', y='Outliers',
+                         title='Estimated IQR Outliers by Column',
+                         labels={'Outliers': 'Outliers', 'Column': 'Column'},
+                         color='Outliers',
+                         color_continuous_scale=['#E6D7F2', '#C9AFE5', '#AC87D8', '#8F5FCB', '#7237BE', '#550FA1', '#4F008C'])
+    outlier_fig.update_layout(showlegend=False, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+
+    table_df = summary.round(2)
+    profile_table = dash_table.DataTable(
+        id='dq-table',
+        columns=[{"name": i, "id": i} for i in table_df.columns],
+        data=table_df.to_dict('records'),
+        style_table={'overflowX': 'auto'},
+        style_header={
+            'backgroundColor': '#4F008C',
+            'color': 'white',
+            'fontWeight': 'bold'
+        },
+        style_cell={
+            'textAlign': 'left',
+            'padding': '10px',
+            'minWidth': '80px'
+        },
+        style_data_conditional=[
+            {
+                'if': {'row_index': 'odd'},
+                'backgroundColor': '#f8f9fa'
+            }
+        ]
+    )
+    return distribution_fig, outlier_fig, profile_table
+
+# callbacks for attrition history
+@app.callback(
+    [Output('survival-chart', 'figure'),
+     Output('cohort-chart', 'figure'),
+     Output('event-trend-chart', 'figure')],
+    [Input('history-dept-filter', 'value'),
+     Input('history-date-range', 'start_date'),
+     Input('history-date-range', 'end_date')]
+)
+
+#--------------------------------------------------------------
+# function to update attrition history charts from the event log
+#--------------------------------------------------------------
+def update_attrition_history(selected_dept, start_date, end_date):
+    version = data_version
+    selected_dept = selected_dept or ALL_DEPARTMENTS
+
+    # survival curves
+    curves = survival_curves(version)
+    if selected_dept != ALL_DEPARTMENTS:
+        curves = curves[curves['Department'].isin(['All Departments', selected_dept])]
+    if not curves.empty:
+        survival_fig = px.line(curves, x='Years', y='Survival', color='Department', line_shape='hv',
+                               title='Kaplan-Meier Survival by Years at Company',
+                               labels={'Survival': 'Still Employed (%)', 'Years': 'Years at Company'},
+                               hover_data=['AtRisk'],
+                               color_discrete_sequence=['#4F008C', '#FF375E', '#AC87D8', '#7237BE', '#FFA3B0'])
+        survival_fig.update_layout(yaxis_range=[0, 101], plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    else:
+        survival_fig = go.Figure()
+        survival_fig.add_annotation(text="No employment events available", x=0.5, y=0.5, showarrow=False)
+
+    # cohort retention
+    retention = cohort_retention(version, selected_dept)
+    if not retention.empty:
+        cohort_fig = go.Figure(data=go.Heatmap(
+            z=retention.values,
+            x=[str(k) for k in retention.columns],
+            y=[str(c) for c in retention.index],
+            colorscale=['#E6D7F2', '#C9AFE5', '#AC87D8', '#8F5FCB', '#7237BE', '#550FA1', '#4F008C'],
+            zmin=0,
+            zmax=100,
+            hoverongaps=False,
+            colorbar=dict(title='Retained (%)'),
+        ))
+        cohort_fig.update_layout(title='Retention by Hire-Year Cohort',
+                                 xaxis_title='Year After Hire (0 = first year)', yaxis_title='Hire Year',
+                                 plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    else:
+        cohort_fig = go.Figure()
+        cohort_fig.add_annotation(text="No employees with recorded hire dates yet", x=0.5, y=0.5, showarrow=False)
+
+    # hires and leavers over time
+    counts = event_counts(version, (start_date or '0000-01-01')[:10], (end_date or '9999-12-31')[:10])
+    if not counts.empty:
+        counts = counts.assign(EventType=counts['EventType'].map({'hire': 'Hires', 'leave': 'Leavers'}))
+        trend_fig = px.bar(counts, x='Period', y='Events', color='EventType', barmode='group',
+                           title='Hires and Leavers per Month',
+                           labels={'Events': 'Employees', 'Period': 'Month', 'EventType': 'Event'},
+                           color_discrete_map={'Hires': '#4F008C', 'Leavers': '#FF375E'})
+        trend_fig.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    else:
+        trend_fig = go.Figure()
+        trend_fig.add_annotation(text="No recorded events in the selected date range", x=0.5, y=0.5, showarrow=False)
+
+    return survival_fig, cohort_fig, trend_fig
+
+# callbacks for what-if simulation
+@app.callback(
+    [Output('sim-cards', 'children'),
+     Output('sim-jobrole-chart', 'figure'),
+     Output('sim-sweep-chart', 'figure')],
+    [Input('sim-dept', 'value'),
+     Input('sim-jobrole', 'value'),
+     Input('sim-income-pct', 'value'),
+     Input('sim-overtime', 'value')]
+)
+
+#--------------------------------------------------------------
+# function to run the what-if simulation for the selected policy
+#--------------------------------------------------------------
+def update_simulation(sim_dept, sim_jobrole, income_pct, overtime):
+    version = data_version
+    try:
+        department, job_role, income_pct, overtime = parse_policy(sim_dept, sim_jobrole, income_pct, overtime)
+    except ValueError as e:
+        empty_fig = go.Figure()
+        empty_fig.add_annotation(text=str(e), x=0.5, y=0.5, showarrow=False)
+        return html.Div(str(e), style={'color': 'red'}), empty_fig, empty_fig
+    result = simulate_policy(version, department, job_role, income_pct, overtime)
+    if result is None:
+        empty_fig = go.Figure()
+        empty_fig.add_annotation(text="Attrition model is not available", x=0.5, y=0.5, showarrow=False)
+        return html.Div("Attrition model is not available", style={'color': 'red'}), empty_fig, empty_fig
+
+    # cards
+    def card(value, label):
+        return html.Div([
+            html.Div([
+                html.Div(value, className='stats-number'),
+                html.Div(label, className='stats-label')
+            ], className='stats-card'),
+        ], style={'width': '23.5%', 'display': 'inline-block', 'padding': '10px'})
+
+    affected_baseline = result['affected_baseline_rate']
+    affected_projected = result['affected_projected_rate']
+    cards = html.Div([
+        card(f"{result['affected_employees']:,}", 'Employees Affected'),
+        card(f"{affected_baseline:.1f}%" if affected_baseline is not None else "-", 'Affected: Baseline Rate'),
+        card(f"{affected_projected:.1f}%" if affected_projected is not None else "-", 'Affected: Projected Rate'),
+        card(f"{result['projected_rate'] - result['baseline_rate']:+.2f} pts", 'Company-wide Change'),
+    ])
+
+    # job role
+    by_role = result['by_job_role'].melt(id_vars='JobRole', var_name='Scenario', value_name='AttritionRate')
+    jobrole_fig = px.bar(by_role, x='JobRole', y='AttritionRate', color='Scenario', barmode='group',
+                         title='Baseline vs Projected Attrition Rate by Job Role',
+                         labels={'AttritionRate': 'Attrition Rate (%)', 'JobRole': 'Job Role'},
+                         color_discrete_map={'Baseline': '#AC87D8', 'Projected': '#4F008C'})
+    jobrole_fig.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+
+    # sweep (each point is a memoized simulation)
+    sweep = pd.DataFrame([
+        {'IncomeChange': pct,
+         'AttritionRate': simulate_policy(version, department, job_role, float(pct), overtime)['affected_projected_rate']}
+        for pct in INCOME_SWEEP
+    ]).dropna()
+    if not sweep.empty:
+        sweep_fig = px.line(sweep, x='IncomeChange', y='AttritionRate', markers=True,
+                            title='Projected Attrition Rate vs Income Change',
+                            labels={'AttritionRate': 'Projected Attrition Rate (%)', 'IncomeChange': 'Monthly Income Change (%)'},
+                            color_discrete_sequence=['#4F008C'])
+        sweep_fig.add_vline(x=income_pct, line_dash='dash', line_color='#FF375E')
+        sweep_fig.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    else:
+        sweep_fig = go.Figure()
+        sweep_fig.add_annotation(text="No employees match the selected filters", x=0.5, y=0.5, showarrow=False)
+
+    return cards, jobrole_fig, sweep_fig
+
 # callback submit
 @app.callback(
     [Output('form-output', 'children'),
      Output('employee-table-container', 'children')],
     [Input('add-employee-btn', 'n_clicks'),
-     Input('update-income-btn', 'n_clicks')],
+     Input('update-income-btn', 'n_clicks'),
+     Input('record-leave-btn', 'n_clicks')],
     [State('new-dept', 'value'),
      State('new-jobrole', 'value'),
      State('new-income', 'value'),
      State('new-overtime', 'value'),
+     State('new-hire-date', 'date'),
      State('employee-id', 'value'),
-     State('update-income', 'value')]
+     State('update-income', 'value'),
+     State('leave-employee-id', 'value'),
+     State('leave-date', 'date')]
 )
 
 #--------------------------------------------------------------
 # function to handle form submissions
 #--------------------------------------------------------------
-def handle_form_submissions(add_clicks, update_clicks, new_dept, new_jobrole, new_income, new_overtime, emp_id, update_income):
+def handle_form_submissions(add_clicks, update_clicks, leave_clicks, new_dept, new_jobrole, new_income, new_overtime, new_hire_date,
+                            emp_id, update_income, leave_emp_id, leave_date):
     ctx = callback_context
     if not ctx.triggered:
         return "", get_employee_table()
@@ -666,9 +1718,17 @@ def handle_form_submissions(add_clicks, update_clicks, new_dept, new_jobrole, ne
                 c.execute('''INSERT INTO Employees (DepartmentID, JobID, MonthlyIncome, OverTime) 
                              VALUES (?, ?, ?, ?)''', 
                          (department_id, job_id, new_income, new_overtime))
+                new_emp_id = c.lastrowid
+
+                hire_date = (new_hire_date or datetime.now().strftime('%Y-%m-%d'))[:10]
+                log_event(c, new_emp_id, 'hire', hire_date, department_id, new_income)
                 
                 conn.commit()
                 conn.close()
+
+                # new rows only need to be added to their partition's sketches
+                profiler.update_rows(load_employees_where("e.EmployeeID = ?", (new_emp_id,)))
+                bump_data_version([new_emp_id])
                 
                 return html.Div("Employee added successfully!", style={'color': 'green'}), get_employee_table()
             else:
@@ -687,22 +1747,73 @@ def handle_form_submissions(add_clicks, update_clicks, new_dept, new_jobrole, ne
                 c = conn.cursor()
                 
                 # check if employee exists
-                c.execute('SELECT EmployeeID FROM Employees WHERE EmployeeID = ?', (emp_id,))
-                if not c.fetchone():
+                c.execute('SELECT EmployeeID, DepartmentID FROM Employees WHERE EmployeeID = ?', (emp_id,))
+                emp_result = c.fetchone()
+                if not emp_result:
                     return html.Div("Employee ID not found", style={'color': 'red'}), get_employee_table()
 
                 # update income
                 c.execute('''UPDATE Employees SET MonthlyIncome = ? 
                              WHERE EmployeeID = ?''', (update_income, emp_id))
+                log_event(c, emp_id, 'income_change', datetime.now().strftime('%Y-%m-%d'), emp_result[1], update_income)
                 
                 conn.commit()
                 conn.close()
+
+                # rebuild only the department partition the employee belongs to
+                emp_df = load_employees_where("e.EmployeeID = ?", (emp_id,))
+                if not emp_df.empty:
+                    dept = emp_df['DepartmentName'].fillna('Unknown').iloc[0]
+                    dept_df = load_employees_where("d.DepartmentName IS ?", (emp_df['DepartmentName'].iloc[0],))
+                    profiler.rebuild_partition(dept, dept_df)
+                bump_data_version([emp_id])
                 
                 return html.Div("Income updated successfully!", style={'color': 'green'}), get_employee_table()
             else:
                 return html.Div("Database connection failed", style={'color': 'red'}), get_employee_table()
         except Exception as e:
             return html.Div(f"Error: {str(e)}", style={'color': 'red'}), get_employee_table()
+
+    elif button_id == 'record-leave-btn' and leave_clicks > 0:
+
+        if not all([leave_emp_id, leave_date]):
+            return html.Div("Please provide both Employee ID and leave date", style={'color': 'red'}), get_employee_table()
+
+        try:
+            conn = get_db_connection()
+            if conn:
+                c = conn.cursor()
+
+                # check if employee exists and is still employed
+                c.execute('SELECT Attrition, DepartmentID, MonthlyIncome FROM Employees WHERE EmployeeID = ?', (leave_emp_id,))
+                emp_result = c.fetchone()
+                if not emp_result:
+                    return html.Div("Employee ID not found", style={'color': 'red'}), get_employee_table()
+                if emp_result[0] == 'Yes':
+                    return html.Div("Employee has already left", style={'color': 'red'}), get_employee_table()
+
+                # leave date must fall between the hire date and today
+                leave_date = leave_date[:10]
+                if leave_date > datetime.now().strftime('%Y-%m-%d'):
+                    return html.Div("Leave date cannot be in the future", style={'color': 'red'}), get_employee_table()
+                c.execute("SELECT MIN(EventDate) FROM EmploymentEvents WHERE EmployeeID = ? AND EventType = 'hire'", (leave_emp_id,))
+                hire_date = c.fetchone()[0]
+                if hire_date and leave_date < hire_date:
+                    return html.Div(f"Leave date cannot be before the hire date ({hire_date})", style={'color': 'red'}), get_employee_table()
+
+                # set attrition and timestamp it in the event log
+                c.execute("UPDATE Employees SET Attrition = 'Yes' WHERE EmployeeID = ?", (leave_emp_id,))
+                log_event(c, leave_emp_id, 'leave', leave_date, emp_result[1], emp_result[2])
+
+                conn.commit()
+                conn.close()
+                bump_data_version([leave_emp_id])
+
+                return html.Div("Leave recorded successfully!", style={'color': 'green'}), get_employee_table()
+            else:
+                return html.Div("Database connection failed", style={'color': 'red'}), get_employee_table()
+        except Exception as e:
+            return html.Div(f"Error: {str(e)}", style={'color': 'red'}), get_employee_table()
     
     return "", get_employee_table()
 
@@ -763,6 +1874,159 @@ def get_employee_table():
             return html.Div(f"Error loading employee data: {str(e)}")
     return html.Div("Database connection failed")
 
+#--------------------------------------------------------------
+# HTTP compression and ETags
+#--------------------------------------------------------------
+COMPRESS_MIN_SIZE = 500
+COMPRESS_MIMETYPES = {'application/json', 'text/html', 'text/css', 'application/javascript', 'text/javascript'}
+COMPRESS_CACHE_SIZE = 128
+# dash layout and dependency payloads get content-hash ETags; callbacks are POSTs,
+# which can't be answered with 304, so they are not hashed
+ETAG_PATHS = ('/_dash-layout', '/_dash-dependencies')
+
+# charts are cached per data version, so the same payloads are compressed repeatedly
+compressed_payloads = OrderedDict()
+compressed_payloads_lock = threading.Lock()
+
+def choose_encoding():
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br'] > 0:
+        return 'br'
+    if accepted['gzip'] > 0:
+        return 'gzip'
+    return None
+
+def compress_payload(body, encoding):
+    key = (hashlib.sha1(body).hexdigest(), encoding)
+    with compressed_payloads_lock:
+        if key in compressed_payloads:
+            compressed_payloads.move_to_end(key)
+            return compressed_payloads[key]
+    if encoding == 'br':
+        data = brotli.compress(body, quality=5)
+    else:
+        data = gzip.compress(body, compresslevel=6)
+    with compressed_payloads_lock:
+        compressed_payloads[key] = data
+        if len(compressed_payloads) > COMPRESS_CACHE_SIZE:
+            compressed_payloads.popitem(last=False)
+    return data
+
+@app.server.after_request
+def etag_and_compress(response):
+    if response.status_code != 200 or response.direct_passthrough or 'Content-Encoding' in response.headers:
+        return response
+
+    # weak ETag (it covers every encoding) made of the data version and the body hash
+    if request.method in ('GET', 'HEAD') and request.path.endswith(ETAG_PATHS) and 'ETag' not in response.headers:
+        etag = f"{data_version}-{hashlib.sha1(response.get_data()).hexdigest()[:20]}"
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'no-cache'
+        if request.if_none_match.contains_weak(etag):
+            response.status_code = 304
+            response.set_data(b'')
+            return response
+
+    encoding = choose_encoding()
+    if encoding and response.mimetype in COMPRESS_MIMETYPES:
+        body = response.get_data()
+        if len(body) >= COMPRESS_MIN_SIZE:
+            response.set_data(compress_payload(body, encoding))
+            response.headers['Content-Encoding'] = encoding
+            response.vary.add('Accept-Encoding')
+    return response
+
+#--------------------------------------------------------------
+# Cache warm-up (background precompute)
+#--------------------------------------------------------------
+# number of precompute tasks allowed to run at the same time
+WARMUP_CONCURRENCY = 2
+
+# precomputes every department's figures and aggregates for a data version
+class WarmupScheduler:
+    def __init__(self, max_workers):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='warmup')
+        self.lock = threading.Lock()
+        self.version = None
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        # true once a version has been warmed without failures, stays true while re-warming
+        self.warm = False
+        self.started_at = None
+        self.finished_at = None
+
+    def tasks(self, version):
+        depts = list(df['DepartmentName'].dropna().unique()) if 'DepartmentName' in df.columns else []
+        tasks = [(load_tenure_table, (version,)), (survival_curves, (version,)), (attrition_model, (version,))]
+        tasks += [(compute_charts, (dept, version)) for dept in [None] + depts]
+        tasks += [(profile_summary, (version, dept)) for dept in [ALL_DEPARTMENTS] + depts]
+        tasks += [(cohort_retention, (version, dept)) for dept in [ALL_DEPARTMENTS] + depts]
+        return tasks
+
+    def schedule(self, version):
+        tasks = self.tasks(version)
+        with self.lock:
+            # concurrent writes can schedule out of order; never go back to an older version
+            if self.version is not None and version <= self.version:
+                return
+            self.version = version
+            self.total = len(tasks)
+            self.done = 0
+            self.failed = 0
+            self.started_at = datetime.now()
+            self.finished_at = None
+        for func, args in tasks:
+            self.executor.submit(self.run, version, func, args)
+
+    def run(self, version, func, args):
+        # skip tasks superseded by a newer data version
+        if version != self.version:
+            return
+        try:
+            func(*args)
+            succeeded = True
+        except Exception as e:
+            print(f"Warm-up task {func.__name__}{args} failed: {e}")
+            succeeded = False
+        with self.lock:
+            if version != self.version:
+                return
+            if succeeded:
+                self.done += 1
+            else:
+                self.failed += 1
+            if self.done + self.failed == self.total:
+                self.finished_at = datetime.now()
+                # a worker with cold caches must not report ready
+                self.warm = self.failed == 0
+                if self.warm:
+                    print(f"Cache warm-up finished for data version {version}")
+                else:
+                    print(f"Cache warm-up for data version {version} finished with {self.failed} failed tasks")
+
+    def status(self):
+        with self.lock:
+            return {
+                'ready': self.warm,
+                'version': self.version,
+                'done': self.done,
+                'total': self.total,
+                'failed': self.failed,
+                'started_at': self.started_at.isoformat() if self.started_at else None,
+                'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            }
+
+
+warmup = WarmupScheduler(WARMUP_CONCURRENCY)
+warmup.schedule(data_version)
+
+# readiness probe: 503 until this worker has warmed its caches once
+@app.server.route('/health/ready')
+def readiness():
+    status = warmup.status()
+    return jsonify(status), (200 if status['ready'] else 503)
+
 # run app
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file